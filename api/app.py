@@ -1,9 +1,10 @@
 import os
+import gzip
+import json
 import logging
-import subprocess
-from flask import Flask, jsonify, request, abort, render_template
-from flasgger import Swagger
-import pandas as pd
+import threading
+from collections import OrderedDict
+from flask import Flask, jsonify, request, abort, render_template, g
 from flask_jwt_extended import (
     JWTManager, create_access_token, create_refresh_token,
     jwt_required, get_jwt_identity
@@ -12,12 +13,22 @@ from flask_jwt_extended import (
 # ===== Configuração base =====
 app = Flask(__name__, template_folder="../templates", static_folder="../static")
 
+# Modo de inicialização rápida (ex.: instâncias que escalam a zero no Render).
+# Adia o import do flasgger até o primeiro acesso a /apidocs e carrega o CSV
+# em segundo plano, enquanto /api/v1/health informa se o dataset está pronto.
+FAST_START = os.environ.get("FAST_START", "").lower() in ("1", "true", "yes")
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional; sem ele, apenas gzip é oferecido
+    brotli = None
+
 # ===== Config JWT =====
 app.config["JWT_SECRET_KEY"] = "fvIenJ1ht1Vszmp15qZOGyK-flTC_2l_hshQ8GQu1ME"
 jwt = JWTManager(app)
 
 # ===== Configuração Swagger =====
-swagger = Swagger(app, template={
+SWAGGER_TEMPLATE = {
     "swagger": "2.0",
     "info": {
         "title": "Tech Challenge - API Books",
@@ -41,7 +52,57 @@ swagger = Swagger(app, template={
             "description": "JWT Authorization header using the Bearer scheme. Example: 'Authorization: Bearer {token}'"
         }
     }
-})
+}
+
+SWAGGER_PATHS = ("/apidocs", "/apispec_1.json", "/flasgger_static", "/oauth2-redirect.html")
+
+class LazySwagger:
+    """
+    Middleware WSGI que só importa o flasgger no primeiro acesso à documentação.
+
+    As rotas do Swagger ficam em uma aplicação Flask separada, criada sob
+    demanda; a especificação continua sendo gerada a partir das rotas e
+    docstrings da API principal.
+    """
+
+    def __init__(self, api_app):
+        self.api_app = api_app
+        self.wsgi_app = api_app.wsgi_app
+        self.docs_app = None
+        self.lock = threading.Lock()
+
+    def build_docs_app(self):
+        from flasgger import Swagger
+
+        docs_app = Flask(__name__)
+        swagger = Swagger(template=SWAGGER_TEMPLATE)
+        build_specs = swagger.get_apispecs
+
+        def get_apispecs(endpoint='apispec_1'):
+            with self.api_app.app_context():
+                return build_specs(endpoint)
+
+        swagger.get_apispecs = get_apispecs
+        swagger.init_app(docs_app)
+        logging.info("Swagger inicializado sob demanda.")
+        return docs_app
+
+    def get_docs_app(self):
+        with self.lock:
+            if self.docs_app is None:
+                self.docs_app = self.build_docs_app()
+        return self.docs_app
+
+    def __call__(self, environ, start_response):
+        if environ.get("PATH_INFO", "").startswith(SWAGGER_PATHS):
+            return self.get_docs_app()(environ, start_response)
+        return self.wsgi_app(environ, start_response)
+
+if FAST_START:
+    app.wsgi_app = LazySwagger(app)
+else:
+    from flasgger import Swagger
+    swagger = Swagger(app, template=SWAGGER_TEMPLATE)
 
 # ===== Configuração de Logs =====
 LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.log")
@@ -55,18 +116,343 @@ logging.info("API iniciada com sucesso.")
 # ===== Carregamento do CSV =====
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CSV_PATH = os.path.join(BASE_DIR, '../data/books.csv')
+CHANGES_PATH = os.path.join(BASE_DIR, '../data/changes.jsonl')
+CATALOG_VERSION_HEADER = "X-Catalog-Version"
 
-try:
-    books_df = pd.read_csv(CSV_PATH, encoding='utf-8')
-except FileNotFoundError:
-    logging.error(f"Arquivo CSV não encontrado em {CSV_PATH}")
-    books_df = pd.DataFrame()
+def load_books(csv_path=CSV_PATH):
+    """
+    Lê o CSV e devolve um DataFrame pronto para ser servido.
+
+    O DataFrame é montado por completo antes de ser retornado, para que quem
+    o publica (ver reload_books) nunca exponha um estado parcial.
+    """
+    import pandas as pd
+
+    try:
+        df = pd.read_csv(csv_path, encoding='utf-8')
+    except FileNotFoundError:
+        logging.error(f"Arquivo CSV não encontrado em {csv_path}")
+        df = pd.DataFrame()
+
+    if not df.empty and 'price' in df.columns:
+        df['price'] = df['price'].str.replace('Â£', '£', regex=False)
+
+    if 'id' not in df.columns:
+        df.insert(0, 'id', range(1, len(df) + 1))
+
+    # 'uid' é estável entre coletas (o 'id' segue a ordem das linhas); CSVs
+    # antigos o derivam do arquivo da imagem, como em scrape_books.book_uid.
+    if 'uid' not in df.columns and 'image_url' in df.columns:
+        df.insert(1, 'uid', df['image_url'].str.rsplit('/', n=1).str[-1].str.split('.', n=1).str[0])
+
+    return df
+
+def load_changes(changes_path=CHANGES_PATH):
+    """
+    Lê o histórico de coletas (data/changes.jsonl) gravado pelo scraper.
+
+    Cada linha é uma versão do catálogo com os livros adicionados, removidos
+    e alterados naquela coleta. Sem o arquivo, o catálogo atual é a versão 0.
+    """
+    if not os.path.exists(changes_path):
+        return []
+
+    changes = []
+    with open(changes_path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            for book in entry['added'] + entry['changed']:
+                if 'price' in book:
+                    book['price'] = book['price'].replace('Â£', '£')
+            changes.append(entry)
+    return changes
+
+def file_mtime(path):
+    """Data de modificação de um arquivo do dataset (None se ele não existir)."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def changes_mtime(changes_path=CHANGES_PATH):
+    """Data de modificação do changes.jsonl (None se ele ainda não existir)."""
+    return file_mtime(changes_path)
+
+def dataset_mtimes():
+    """Datas de modificação de books.csv e changes.jsonl, nessa ordem."""
+    return (file_mtime(CSV_PATH), changes_mtime())
+
+def current_changes():
+    """
+    Devolve o histórico de coletas, relendo changes.jsonl se ele mudou em disco.
+
+    Uma coleta recarrega só o worker que a executou (ver reload_books); a
+    checagem do mtime mantém o feed de alterações igual em todos os workers.
+    """
+    global books_changes
+    mtime = changes_mtime()
+    if mtime != books_changes[0]:
+        books_changes = (mtime, load_changes())
+    return books_changes[1]
+
+RATING_MAP = {"One": 1, "Two": 2, "Three": 3, "Four": 4, "Five": 5}
+
+def build_numeric_columns(df):
+    """
+    Pré-calcula as colunas numéricas usadas pelos endpoints de distribuição.
+
+    Fica em um DataFrame à parte para não alterar o formato dos registros
+    devolvidos pelas rotas de livros.
+    """
+    import pandas as pd
+
+    if df.empty:
+        return pd.DataFrame({
+            'category_key': pd.Series(dtype=object),
+            'price': pd.Series(dtype=float),
+            'rating_num': pd.Series(dtype=int),
+        })
+
+    return pd.DataFrame({
+        'category_key': df['category'].str.lower(),
+        'price': pd.to_numeric(df['price'].str.replace('£', '', regex=False), errors='coerce'),
+        # 0 = rating ausente ou fora do RATING_MAP
+        'rating_num': df['rating'].map(RATING_MAP).fillna(0).astype(int),
+    })
+
+def reload_books():
+    """
+    Recarrega o CSV e troca o DataFrame servido em uma única atribuição.
+
+    Requisições em andamento continuam com a referência antiga; as novas já
+    enxergam o dataset completo. Com o gunicorn em modo preload, o dataset é
+    carregado uma vez no master e compartilhado (copy-on-write) pelos workers;
+    uma recarga aqui vale para o worker que a executou, e os demais a repetem
+    ao perceber os arquivos novos (ver refresh_books_if_changed).
+    """
+    global books_df, books_numeric, books_changes, books_version, books_mtimes
+    with books_reload_lock:
+        # As datas são lidas antes dos arquivos: se eles mudarem durante a
+        # leitura, a próxima checagem dispara outra recarga.
+        mtimes = dataset_mtimes()
+        # O histórico é lido antes do CSV (o scraper grava na ordem inversa): a
+        # versão associada ao catálogo nunca fica à frente dos dados, no máximo
+        # atrás, e reaplicar um diff já contido no catálogo é inofensivo.
+        changes = (mtimes[1], load_changes())
+        df = load_books()
+        df.attrs['catalog_version'] = changes[1][-1]['version'] if changes[1] else 0
+        books_changes = changes
+        books_numeric = build_numeric_columns(df)
+        books_df = df
+        # Incrementada só depois da troca: quem lê a versão V enxerga dados >= V.
+        books_version += 1
+        books_mtimes = mtimes
+        books_ready.set()
+    logging.info(f"Dataset carregado: {len(books_df)} livros.")
+
+def refresh_books_if_changed():
+    """
+    Recarrega o dataset se books.csv ou changes.jsonl mudaram em disco.
+
+    O trigger de scraping recarrega apenas o worker que o atendeu; os demais
+    percebem os arquivos novos por esta checagem (um stat por arquivo) na
+    próxima requisição, então todos passam a servir o mesmo catálogo. Depois
+    da recarga, a cópia do worker deixa de ser compartilhada com o master.
+    """
+    global books_mtimes
+    mtimes = dataset_mtimes()
+    if mtimes == books_mtimes or books_reload_lock.locked():
+        return
+    try:
+        reload_books()
+    except Exception as e:
+        # Mantém o dataset atual e só tenta de novo quando os arquivos mudarem.
+        books_mtimes = mtimes
+        logging.error(f"Erro ao recarregar o dataset: {e}", exc_info=True)
+
+def load_books_in_background():
+    """Alvo da thread de carregamento; registra a falha em vez de perdê-la."""
+    global books_load_error
+    try:
+        reload_books()
+    except Exception as e:
+        books_load_error = e
+        logging.error(f"Erro ao carregar o dataset em segundo plano: {e}", exc_info=True)
+    finally:
+        books_load_finished.set()
+
+def start_background_load():
+    """Dispara o carregamento do CSV em uma thread, se ainda não iniciado."""
+    global books_loader
+    if books_loader is None and not books_ready.is_set():
+        books_loader = threading.Thread(target=load_books_in_background, name="books-loader", daemon=True)
+        books_loader.start()
+
+def wait_for_background_load():
+    """
+    Aguarda o carregamento em segundo plano antes de criar processos filhos.
+
+    Threads não sobrevivem ao fork: se o gunicorn fizer preload com FAST_START,
+    os workers só podem ser criados depois que o master terminar o carregamento
+    (inclusive o import do pandas), herdando o dataset já pronto. Chamado pelo
+    hook when_ready do gunicorn.conf.py.
+    """
+    if books_loader is not None:
+        books_loader.join()
+
+books_df = None
+books_numeric = None
+books_changes = (None, [])  # (mtime do changes.jsonl, entradas)
+books_version = 0
+books_mtimes = (None, None)  # (books.csv, changes.jsonl) da última carga
+books_reload_lock = threading.Lock()
+books_ready = threading.Event()
+books_load_finished = threading.Event()
+books_load_error = None
+books_loader = None
+DATASET_WAIT_TIMEOUT = 30  # em segundos
+
+if FAST_START:
+    start_background_load()
+else:
+    reload_books()
+    books_load_finished.set()
+
+# Rotas que respondem sem depender do dataset (o trigger de scraping permite
+# recuperar um carregamento que falhou)
+DATASET_FREE_ENDPOINTS = {"home", "static", "login", "refresh_token", "health", "trigger_scraping"}
+
+@app.before_request
+def wait_for_books():
+    """
+    Aguarda o carregamento do dataset antes de atender rotas que o utilizam e
+    o recarrega se uma nova coleta foi gravada por outro worker.
+    """
+    if request.endpoint in DATASET_FREE_ENDPOINTS:
+        return None
+    if not books_ready.is_set():
+        if not books_load_finished.wait(DATASET_WAIT_TIMEOUT):
+            logging.warning(f"Dataset ainda carregando; rota '{request.path}' recusada.")
+            return jsonify({"error": "Dataset is still loading"}), 503
+        if not books_ready.is_set():
+            return jsonify({"error": "Dataset failed to load"}), 503
+    refresh_books_if_changed()
+    return None
+
+# ===== Compressão de respostas =====
+COMPRESSION_MIN_SIZE = 1024  # em bytes
+# Arquivos estáticos chegam como direct_passthrough e são servidos sem compressão
+COMPRESSIBLE_MIMETYPES = {"application/json", "text/html"}
+
+# Rotas cujo corpo só muda com a versão do dataset: a resposta comprimida é
+# guardada por (versão, recurso, encoding) e servida sem serializar de novo.
+# As de chave fixa ignoram a query string e são comprimidas no nível máximo;
+# a busca tem uma chave por filtro normalizado e usa o nível padrão.
+FIXED_KEY_ENDPOINTS = {"get_books", "ml_training_data"}
+PRECOMPRESSED_ENDPOINTS = FIXED_KEY_ENDPOINTS | {"search_books"}
+PRECOMPRESSED_CACHE_SIZE = 128
+# Headers da resposta original que também são servidos a partir do cache
+PRECOMPRESSED_HEADERS = (CATALOG_VERSION_HEADER,)
+
+precompressed_cache = OrderedDict()
+precompressed_cache_version = 0
+precompressed_cache_lock = threading.Lock()
+
+def choose_encoding():
+    """Escolhe o Content-Encoding aceito pelo cliente (br > gzip) ou None."""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted.quality("br") > 0:
+        return "br"
+    if accepted.quality("gzip") > 0:
+        return "gzip"
+    return None
+
+def compress(data, encoding, max_level=False):
+    """
+    Comprime o corpo da resposta.
+
+    Rotas de chave fixa usam o nível máximo, já que o custo é pago uma vez por
+    versão do dataset; as demais usam um nível mais barato.
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=11 if max_level else 5)
+    return gzip.compress(data, compresslevel=9 if max_level else 6, mtime=0)
+
+def precompressed_key(encoding):
+    """Chave do cache: só os parâmetros que a rota de fato usa entram nela."""
+    if request.endpoint == "search_books":
+        resource = (
+            request.endpoint,
+            request.args.get("title", "").lower(),
+            request.args.get("category", "").lower()
+        )
+    else:
+        resource = (request.endpoint,)
+    return (g.books_version, resource, encoding)
+
+@app.before_request
+def serve_precompressed():
+    """Devolve direto do cache a resposta já comprimida, se houver."""
+    g.books_version = books_version
+    if request.method != "GET" or request.endpoint not in PRECOMPRESSED_ENDPOINTS:
+        return None
+    encoding = choose_encoding()
+    if encoding is None:
+        return None
+    key = precompressed_key(encoding)
+    with precompressed_cache_lock:
+        cached = precompressed_cache.get(key)
+        if cached is not None:
+            precompressed_cache.move_to_end(key)
+    if cached is None:
+        return None
+    body, mimetype, headers = cached
+    response = app.response_class(body, mimetype=mimetype, headers=headers)
+    response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
 
-if not books_df.empty and 'price' in books_df.columns:
-    books_df['price'] = books_df['price'].str.replace('Â£', '£', regex=False)
+@app.after_request
+def compress_response(response):
+    """Comprime respostas grandes conforme o Accept-Encoding do cliente."""
+    global precompressed_cache_version
+    if (
+        response.direct_passthrough
+        or response.status_code != 200
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
 
-if 'id' not in books_df.columns:
-    books_df.insert(0, 'id', range(1, len(books_df) + 1))
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding()
+    data = response.get_data()
+    if encoding is None or len(data) < COMPRESSION_MIN_SIZE:
+        return response
+
+    cacheable = request.method == "GET" and request.endpoint in PRECOMPRESSED_ENDPOINTS
+    body = compress(data, encoding, max_level=request.endpoint in FIXED_KEY_ENDPOINTS)
+    if cacheable:
+        with precompressed_cache_lock:
+            # Uma nova versão do dataset descarta as entradas antigas; respostas
+            # de requisições iniciadas antes da recarga não entram no cache.
+            if g.books_version > precompressed_cache_version:
+                precompressed_cache.clear()
+                precompressed_cache_version = g.books_version
+            if g.books_version == precompressed_cache_version:
+                headers = {
+                    name: response.headers[name]
+                    for name in PRECOMPRESSED_HEADERS if name in response.headers
+                }
+                precompressed_cache[precompressed_key(encoding)] = (body, response.mimetype, headers)
+                if len(precompressed_cache) > PRECOMPRESSED_CACHE_SIZE:
+                    precompressed_cache.popitem(last=False)
+
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    return response
 
 # ===== Usuários de teste =====
 USERS = {"admin": "password123"}
@@ -183,6 +569,7 @@ def trigger_scraping():
 
         books = scrape_books()
         save_to_csv(books)
+        reload_books()
 
         logging.info("Scraping concluído com sucesso.")
         return jsonify({"msg": "Scraping concluído com sucesso."})
@@ -201,9 +588,74 @@ def get_books():
     responses:
       200:
         description: Lista de livros
+        headers:
+          X-Catalog-Version:
+            type: integer
+            description: Versão do catálogo desta lista, para usar como since em /api/v1/books/changes
     """
     logging.info("Rota '/api/v1/books' acessada.")
-    return jsonify(books_df.to_dict(orient="records"))
+    df = books_df
+    response = jsonify(df.to_dict(orient="records"))
+    response.headers[CATALOG_VERSION_HEADER] = str(df.attrs.get('catalog_version', 0))
+    return response
+
+@app.route("/api/v1/books/changes", methods=["GET"])
+def get_book_changes():
+    """
+    Alterações no catálogo desde uma versão
+    ---
+    tags:
+      - Books
+    parameters:
+      - in: query
+        name: since
+        type: integer
+        required: true
+        example: 0
+    responses:
+      200:
+        description: Livros adicionados, alterados (registros completos) e removidos (uids) desde a versão informada
+      400:
+        description: Parâmetro since ausente ou versão desconhecida
+    """
+    since = request.args.get("since", type=int)
+    logging.info(f"Rota '/api/v1/books/changes' acessada com since={since}.")
+
+    changes = current_changes()
+    version = changes[-1]["version"] if changes else 0
+    if since is None or since < 0 or since > version:
+        return jsonify({"error": "Parameter 'since' must be a known version", "version": version}), 400
+
+    # Combina as coletas posteriores a 'since' em um único diff por uid.
+    added, changed, removed = {}, {}, set()
+    for entry in changes:
+        if entry["version"] <= since:
+            continue
+        for book in entry["added"]:
+            if book["uid"] in removed:
+                removed.discard(book["uid"])
+                changed[book["uid"]] = book
+            else:
+                added[book["uid"]] = book
+        for book in entry["changed"]:
+            if book["uid"] in added:
+                added[book["uid"]] = book
+            else:
+                changed[book["uid"]] = book
+        for uid in entry["removed"]:
+            if uid in added:
+                del added[uid]
+            else:
+                changed.pop(uid, None)
+                removed.add(uid)
+
+    return jsonify({
+        "since": since,
+        "version": version,
+        "added": list(added.values()),
+        "changed": list(changed.values()),
+        "removed": sorted(removed)
+    })
 
 @app.route("/api/v1/books/<int:book_id>", methods=["GET"])
 def get_book(book_id):
@@ -225,7 +677,8 @@ def get_book(book_id):
         description: Livro não encontrado
     """
     logging.info(f"Rota '/api/v1/books/{book_id}' acessada.")
-    book = books_df[books_df['id'] == book_id]
+    df = books_df
+    book = df[df['id'] == book_id]
     if book.empty:
         logging.warning(f"Livro com ID {book_id} não encontrado.")
         abort(404, description="Book not found")
@@ -290,8 +743,14 @@ def health():
     responses:
       200:
         description: Status da API
+      503:
+        description: Dataset ainda em carregamento ou com falha no carregamento (modo FAST_START)
     """
     logging.info("Rota '/api/v1/health' acessada.")
+    if not books_ready.is_set():
+        if books_load_error is not None:
+            return jsonify({"status": "error", "books_count": 0, "error": str(books_load_error)}), 503
+        return jsonify({"status": "loading", "books_count": 0}), 503
     return jsonify({"status": "ok", "books_count": len(books_df)})
 
 # ===== Insights Endpoints =====
@@ -342,6 +801,115 @@ def stats_categories():
     category_stats['average_price'] = category_stats['average_price'].round(2)
     return jsonify(category_stats.to_dict(orient='index'))
 
+def filter_numeric(df, category=None, min_price=None, max_price=None):
+    """Aplica os filtros opcionais de categoria (exata, sem caixa) e preço."""
+    mask = df['price'].notna()
+    if category:
+        mask &= df['category_key'] == category.lower()
+    if min_price is not None:
+        mask &= df['price'] >= min_price
+    if max_price is not None:
+        mask &= df['price'] <= max_price
+    return df[mask]
+
+@app.route('/api/v1/stats/histogram', methods=['GET'])
+def stats_histogram():
+    """
+    Histograma de preços
+    ---
+    tags:
+      - Stats
+    parameters:
+      - in: query
+        name: category
+        type: string
+        required: false
+        example: Travel
+      - in: query
+        name: min
+        type: number
+        required: false
+        example: 20
+      - in: query
+        name: max
+        type: number
+        required: false
+        example: 50
+      - in: query
+        name: bins
+        type: integer
+        required: false
+        example: 12
+    responses:
+      200:
+        description: Limites e contagem de cada faixa de preço
+    """
+    import numpy as np
+
+    category = request.args.get('category', '')
+    min_price = request.args.get('min', type=float)
+    max_price = request.args.get('max', type=float)
+    bins = min(max(request.args.get('bins', 12, type=int), 1), 100)
+    logging.info(f"Rota '/api/v1/stats/histogram' acessada. Filtros: category={category}, min={min_price}, max={max_price}, bins={bins}")
+
+    prices = filter_numeric(books_numeric, category, min_price, max_price)['price'].to_numpy()
+    if prices.size == 0:
+        return jsonify({"total": 0, "edges": [], "counts": []})
+
+    counts, edges = np.histogram(prices, bins=bins)
+    return jsonify({
+        "total": int(prices.size),
+        "edges": [round(float(edge), 2) for edge in edges],
+        "counts": counts.tolist()
+    })
+
+@app.route('/api/v1/stats/distribution', methods=['GET'])
+def stats_distribution():
+    """
+    Distribuição de ratings
+    ---
+    tags:
+      - Stats
+    parameters:
+      - in: query
+        name: category
+        type: string
+        required: false
+        example: Travel
+      - in: query
+        name: min
+        type: number
+        required: false
+        example: 20
+      - in: query
+        name: max
+        type: number
+        required: false
+        example: 50
+    responses:
+      200:
+        description: Contagem de livros por rating (1 a 5), livros sem rating reconhecido (unrated), preço médio e número de categorias
+    """
+    import numpy as np
+
+    category = request.args.get('category', '')
+    min_price = request.args.get('min', type=float)
+    max_price = request.args.get('max', type=float)
+    logging.info(f"Rota '/api/v1/stats/distribution' acessada. Filtros: category={category}, min={min_price}, max={max_price}")
+
+    filtered = filter_numeric(books_numeric, category, min_price, max_price)
+    # rating_num 0 marca ratings fora do RATING_MAP, informados à parte em 'unrated'
+    counts = np.bincount(filtered['rating_num'].to_numpy(), minlength=6)
+    average_price = round(float(filtered['price'].mean()), 2) if not filtered.empty else None
+    return jsonify({
+        "total": len(filtered),
+        "average_price": average_price,
+        "ratings": list(RATING_MAP.values()),
+        "counts": counts[1:6].tolist(),
+        "unrated": int(counts[0]),
+        "categories": int(filtered['category_key'].nunique())
+    })
+
 @app.route('/api/v1/books/top-rated', methods=['GET'])
 def top_rated_books():
     """
@@ -1,10 +1,7 @@
 import streamlit as st
 import pandas as pd
-import requests
-import seaborn as sns
 import matplotlib.pyplot as plt
-import os
-import re
+from dashboard_data import API_BASE, load_books, fetch_api_data, compute_chart_data
 
 # ===== Configurações do Streamlit =====
 st.set_page_config(
@@ -45,29 +42,10 @@ st.markdown(f"""
 st.title("Dashboard - API Books")
 st.markdown("Visualização interativa e métricas da API, filtragem de livros e gráficos interativos.")
 
-# ===== Função para carregar CSV =====
-@st.cache_data
-def load_books():
-    csv_path = os.path.join(os.path.dirname(__file__), "data", "books.csv")
-    if not os.path.exists(csv_path):
-        st.warning("Arquivo books.csv não encontrado. Execute o scraping antes.")
-        return pd.DataFrame()
-    
-    df = pd.read_csv(csv_path, encoding="utf-8")
-    
-    # Limpa preços: remove qualquer caractere que não seja número ou ponto
-    if 'price' in df.columns:
-        df['price'] = df['price'].apply(lambda x: float(re.sub(r'[^0-9.]', '', str(x))))
-    
-    # Adiciona coluna numérica para rating
-    rating_map = {"One": 1, "Two": 2, "Three": 3, "Four": 4, "Five": 5}
-    if 'rating' in df.columns:
-        df['rating_num'] = df['rating'].map(rating_map)
-    
-    return df
-
+# ===== Carregamento dos dados =====
 books_df = load_books()
 if books_df.empty:
+    st.warning("Arquivo books.csv não encontrado. Execute o scraping antes.")
     st.stop()
 
 # ===== Sidebar filtros =====
@@ -88,17 +66,27 @@ filtered_df = books_df[(books_df['price'] >= price_min) & (books_df['price'] <=
 if selected_category != "Todas":
     filtered_df = filtered_df[filtered_df['category'] == selected_category]
 
+# ===== Dados das métricas e gráficos (mesmo CSV das tabelas) =====
+chart_data = compute_chart_data(
+    books_df,
+    None if selected_category == "Todas" else selected_category,
+    price_min,
+    price_max
+)
+distribution = chart_data["distribution"]
+histogram = chart_data["histogram"]
+
 # ===== Estatísticas gerais =====
 st.subheader("Estatísticas Gerais")
 col1, col2, col3 = st.columns(3)
-col1.metric("Total de Livros", len(filtered_df))
-col2.metric("Preço Médio", f"£{filtered_df['price'].mean():.2f}" if not filtered_df.empty else "0")
-col3.metric("Categorias Ativas", filtered_df['category'].nunique())
+col1.metric("Total de Livros", distribution["total"])
+col2.metric("Preço Médio", f"£{distribution['average_price']:.2f}" if distribution["average_price"] is not None else "0")
+col3.metric("Categorias Ativas", distribution["categories"])
 
 # ===== Distribuição de Ratings =====
 st.subheader("Distribuição de Ratings")
 fig, ax = plt.subplots(figsize=(5,3))
-sns.countplot(x='rating', data=filtered_df, color=PRIMARY_COLOR, ax=ax)
+ax.bar([str(r) for r in distribution["ratings"]], distribution["counts"], color=PRIMARY_COLOR)
 ax.set_facecolor(SECONDARY_COLOR)
 ax.set_title("Distribuição de Ratings", fontsize=10, color=GRAPH_TEXT_COLOR)
 ax.set_xlabel("Rating", fontsize=9, color=GRAPH_TEXT_COLOR)
@@ -109,7 +97,8 @@ st.pyplot(fig, clear_figure=True)
 # ===== Distribuição de Preços =====
 st.subheader("Distribuição de Preços")
 fig, ax = plt.subplots(figsize=(5,3))
-sns.histplot(filtered_df['price'], bins=12, color=PRIMARY_COLOR, ax=ax)
+if histogram["counts"]:
+    ax.stairs(histogram["counts"], histogram["edges"], fill=True, color=PRIMARY_COLOR)
 ax.set_facecolor(SECONDARY_COLOR)
 ax.set_title("Histograma de Preços", fontsize=10, color=GRAPH_TEXT_COLOR)
 ax.set_xlabel("Preço (£)", fontsize=9, color=GRAPH_TEXT_COLOR)
@@ -128,21 +117,20 @@ top_rating = filtered_df.sort_values(by='rating_num', ascending=False).head(10)
 st.dataframe(top_rating[['title','category','price','rating']], width='stretch')
 
 # ===== Métricas da API =====
+api_data = fetch_api_data(API_BASE)
+
 st.subheader("Métricas da API")
-API_BASE = "https://tech-challenge-books-api-mkqn.onrender.com/api/v1"
-try:
-    health = requests.get(f"{API_BASE}/health").json()
-    st.json(health)
-except:
+if api_data["health"] is not None:
+    st.json(api_data["health"])
+else:
     st.error("Não foi possível acessar a API /health.")
 
 # ===== Estatísticas por Categoria via API =====
 st.subheader("Estatísticas por Categoria")
-try:
-    cat_stats = requests.get(f"{API_BASE}/stats/categories").json()
-    cat_df = pd.DataFrame.from_dict(cat_stats, orient='index')
+if api_data["categories"] is not None:
+    cat_df = pd.DataFrame.from_dict(api_data["categories"], orient='index')
     st.bar_chart(cat_df[['books_count', 'average_price']])
-except:
+else:
     st.warning("Não foi possível acessar estatísticas por categoria.")
 
 st.markdown("---")
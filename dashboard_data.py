@@ -0,0 +1,164 @@
+"""
+dashboard_data.py
+-----------------
+Camada de acesso a dados do dashboard Streamlit.
+
+- Lê o books.csv local com limpeza vetorizada de preços.
+- Consulta a API em paralelo, com timeout e cache com TTL, para que as
+  interações do usuário (filtros, sliders) não esperem por chamadas remotas.
+- Calcula as métricas filtradas e os gráficos (histograma de preços e
+  distribuição de ratings) sobre o CSV já carregado, com binning vetorizado
+  e no mesmo formato de /stats/histogram e /stats/distribution. Assim as
+  métricas, os gráficos e as tabelas vêm do mesmo dataset e nenhuma
+  interação espera pela rede.
+
+A URL base da API pode ser trocada pela variável de ambiente API_BASE_URL,
+por exemplo para apontar para uma instância local:
+
+    API_BASE_URL=http://localhost:5000/api/v1 streamlit run dashboard.py
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+import requests
+import streamlit as st
+
+# ===== Constantes =====
+API_BASE = os.environ.get(
+    "API_BASE_URL", "https://tech-challenge-books-api-mkqn.onrender.com/api/v1"
+).rstrip("/")
+CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "books.csv")
+REQUEST_TIMEOUT = 5  # em segundos
+CHART_BINS = 12
+API_CACHE_TTL = 60  # em segundos
+RATING_MAP = {"One": 1, "Two": 2, "Three": 3, "Four": 4, "Five": 5}
+
+# ===== Dados locais =====
+@st.cache_data
+def load_books(csv_path: str = CSV_PATH) -> pd.DataFrame:
+    """
+    Carrega o CSV de livros e adiciona as colunas numéricas usadas nos gráficos.
+
+    Args:
+        csv_path (str): Caminho do arquivo CSV.
+
+    Returns:
+        pd.DataFrame: Livros com 'price' em float e 'rating_num'; vazio se o
+        arquivo não existir.
+    """
+    if not os.path.exists(csv_path):
+        return pd.DataFrame()
+
+    df = pd.read_csv(csv_path, encoding="utf-8")
+
+    # Limpa preços: remove qualquer caractere que não seja número ou ponto
+    if 'price' in df.columns:
+        df['price'] = pd.to_numeric(
+            df['price'].astype(str).str.replace(r'[^0-9.]', '', regex=True),
+            errors='coerce'
+        )
+
+    if 'rating' in df.columns:
+        df['rating_num'] = df['rating'].map(RATING_MAP)
+
+    return df
+
+# ===== Dados da API =====
+def get_json(path: str, api_base: str = API_BASE) -> Optional[Any]:
+    """
+    Faz GET em um endpoint da API e devolve o JSON, ou None em caso de falha.
+
+    Args:
+        path (str): Caminho relativo à URL base (ex.: '/health').
+        api_base (str): URL base da API.
+
+    Returns:
+        Optional[Any]: Corpo JSON da resposta ou None.
+    """
+    try:
+        response = requests.get(f"{api_base}{path}", timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+def fetch_all(paths: Dict[str, str], api_base: str = API_BASE) -> Dict[str, Optional[Any]]:
+    """
+    Faz em paralelo um GET para cada caminho informado.
+
+    Args:
+        paths (Dict[str, str]): Nome de cada resultado -> caminho relativo.
+        api_base (str): URL base da API.
+
+    Returns:
+        Dict[str, Optional[Any]]: JSON de cada caminho, pelo mesmo nome
+        (None para os que falharam).
+    """
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        futures = {name: executor.submit(get_json, path, api_base) for name, path in paths.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def fetch_api_data(api_base: str = API_BASE) -> Dict[str, Optional[Any]]:
+    """
+    Busca em paralelo os dados da API exibidos no dashboard.
+
+    O resultado fica em cache por API_CACHE_TTL segundos, então as reexecuções
+    do script disparadas pelos filtros não fazem novas chamadas de rede.
+
+    Args:
+        api_base (str): URL base da API.
+
+    Returns:
+        Dict[str, Optional[Any]]: Respostas de 'health' e 'categories'
+        (None para as que falharam).
+    """
+    paths = {"health": "/health", "categories": "/stats/categories"}
+    return fetch_all(paths, api_base)
+
+def compute_chart_data(
+    df: pd.DataFrame, category: Optional[str], price_min: float, price_max: float
+) -> Dict[str, Any]:
+    """
+    Calcula os mesmos agregados de /stats/histogram e /stats/distribution,
+    com binning vetorizado sobre o CSV já carregado (cerca de 10 ms).
+
+    Args:
+        df (pd.DataFrame): Livros retornados por load_books.
+        category (Optional[str]): Categoria selecionada ou None para todas.
+        price_min (float): Preço mínimo.
+        price_max (float): Preço máximo.
+
+    Returns:
+        Dict[str, Any]: 'histogram' e 'distribution' no formato da API.
+    """
+    mask = df['price'].notna() & (df['price'] >= price_min) & (df['price'] <= price_max)
+    if category:
+        mask &= df['category'].str.lower() == category.lower()
+    filtered = df[mask]
+
+    prices = filtered['price'].to_numpy()
+    if prices.size:
+        counts, edges = np.histogram(prices, bins=CHART_BINS)
+        histogram = {
+            "total": int(prices.size),
+            "edges": [round(float(edge), 2) for edge in edges],
+            "counts": counts.tolist()
+        }
+    else:
+        histogram = {"total": 0, "edges": [], "counts": []}
+
+    rating_counts = np.bincount(filtered['rating_num'].fillna(0).astype(int).to_numpy(), minlength=6)
+    distribution = {
+        "total": len(filtered),
+        "average_price": round(float(filtered['price'].mean()), 2) if not filtered.empty else None,
+        "ratings": list(RATING_MAP.values()),
+        "counts": rating_counts[1:6].tolist(),
+        "unrated": int(rating_counts[0]),
+        "categories": int(filtered['category'].str.lower().nunique())
+    }
+    return {"histogram": histogram, "distribution": distribution}
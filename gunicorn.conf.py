@@ -0,0 +1,46 @@
+"""
+gunicorn.conf.py
+----------------
+Configuração do gunicorn para servir a API em produção.
+
+Uso:
+    gunicorn -c gunicorn.conf.py api.app:app
+
+Com preload_app, o módulo api/app.py (e o books.csv) é carregado uma única vez
+no processo master antes do fork. Os workers herdam as mesmas páginas de
+memória (copy-on-write) em vez de cada um manter sua própria cópia do dataset.
+"""
+
+import gc
+import os
+import sys
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+
+# FAST_START (ver api/app.py) e preload trabalham um contra o outro: com
+# preload, o master precisa terminar o carregamento antes do fork, então a
+# inicialização não fica mais rápida. Com FAST_START, cada worker carrega o
+# dataset por conta própria, em segundo plano.
+FAST_START = os.environ.get("FAST_START", "").lower() in ("1", "true", "yes")
+preload_app = not FAST_START
+
+def when_ready(server):
+    """
+    Congela os objetos já carregados antes do fork dos workers.
+
+    O gc.freeze() move os objetos para a geração permanente, evitando que o
+    coletor de lixo dos workers escreva nos cabeçalhos desses objetos e force
+    a cópia das páginas compartilhadas.
+
+    Se a aplicação foi pré-carregada com FAST_START (ex.: --preload na linha de
+    comando), aguarda antes a thread de carregamento do dataset, que não
+    sobreviveria ao fork.
+    """
+    if server.cfg.preload_app:
+        app_module = sys.modules.get(server.app.wsgi().import_name)
+        wait_for_background_load = getattr(app_module, "wait_for_background_load", None)
+        if wait_for_background_load is not None:
+            wait_for_background_load()
+    gc.freeze()
+    server.log.info("Objetos do master congelados (gc.freeze) antes do fork.")
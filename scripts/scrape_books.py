@@ -11,13 +11,19 @@ Coleta:
 - Disponibilidade
 - Categoria
 - URL da imagem
+- Identificador estável (uid), derivado do arquivo da imagem
+
+A cada execução, as diferenças em relação ao CSV anterior (livros adicionados,
+removidos e alterados) são registradas em data/changes.jsonl.
 """
 
 import os
 import csv
+import json
 import time
 import logging
-from typing import List, Dict
+from datetime import datetime, timezone
+from typing import List, Dict, Optional
 import requests
 from bs4 import BeautifulSoup
 
@@ -25,6 +31,7 @@ from bs4 import BeautifulSoup
 BASE_URL = "https://books.toscrape.com/"
 CATALOGUE_URL = BASE_URL + "catalogue/"
 CSV_FILEPATH = "data/books.csv"
+CHANGES_FILENAME = "changes.jsonl"
 DELAY_BETWEEN_REQUESTS = 1  # em segundos
 
 # ===== Configuração do Logging =====
@@ -49,6 +56,21 @@ def get_soup(url: str) -> BeautifulSoup:
     response.raise_for_status()
     return BeautifulSoup(response.text, "lxml")
 
+def book_uid(image_url: str) -> str:
+    """
+    Gera o identificador estável de um livro a partir da URL da imagem.
+
+    O nome do arquivo da capa no Books to Scrape é um hash único por livro e
+    não depende da ordem de coleta, ao contrário do 'id' sequencial da API.
+
+    Args:
+        image_url (str): URL da imagem do livro.
+
+    Returns:
+        str: Nome do arquivo da imagem, sem extensão.
+    """
+    return image_url.rsplit("/", 1)[-1].split(".", 1)[0]
+
 def parse_book(article: BeautifulSoup, category: str) -> Dict[str, str]:
     """
     Extrai informações de um livro a partir do HTML.
@@ -67,6 +89,7 @@ def parse_book(article: BeautifulSoup, category: str) -> Dict[str, str]:
     image_url = BASE_URL + article.img["src"].replace("../", "")
 
     return {
+        "uid": book_uid(image_url),
         "title": title,
         "price": price,
         "rating": rating,
@@ -127,26 +150,135 @@ def scrape_books() -> List[Dict[str, str]]:
     logging.info(f"Total de livros coletados: {len(all_books)}")
     return all_books
 
-def save_to_csv(books: List[Dict[str, str]], filepath: str = CSV_FILEPATH) -> None:
+def load_csv(filepath: str) -> List[Dict[str, str]]:
+    """
+    Lê os livros de um CSV salvo anteriormente.
+
+    Args:
+        filepath (str): Caminho do arquivo CSV.
+
+    Returns:
+        List[Dict[str, str]]: Livros do arquivo (com 'uid'), ou lista vazia se
+        o arquivo não existir.
+    """
+    if not os.path.exists(filepath):
+        return []
+
+    with open(filepath, newline="", encoding="utf-8") as f:
+        books = list(csv.DictReader(f))
+
+    # CSVs anteriores à coluna 'uid' derivam o identificador da imagem.
+    for book in books:
+        if not book.get("uid"):
+            book["uid"] = book_uid(book["image_url"])
+    return books
+
+def diff_books(
+    old_books: List[Dict[str, str]], new_books: List[Dict[str, str]]
+) -> Dict[str, list]:
+    """
+    Compara duas coletas pelo 'uid' dos livros.
+
+    Args:
+        old_books (List[Dict[str, str]]): Livros da coleta anterior.
+        new_books (List[Dict[str, str]]): Livros da coleta atual.
+
+    Returns:
+        Dict[str, list]: 'added' e 'changed' com os registros atuais e
+        'removed' com os uids que deixaram o catálogo.
+    """
+    old_by_uid = {book["uid"]: book for book in old_books}
+    new_by_uid = {book["uid"]: book for book in new_books}
+
+    added = [book for uid, book in new_by_uid.items() if uid not in old_by_uid]
+    changed = [
+        book for uid, book in new_by_uid.items()
+        if uid in old_by_uid
+        and any(old_by_uid[uid].get(field) != value for field, value in book.items())
+    ]
+    removed = [uid for uid in old_by_uid if uid not in new_by_uid]
+    return {"added": added, "removed": removed, "changed": changed}
+
+def last_changes_version(changes_filepath: str) -> int:
+    """
+    Retorna a versão da última coleta registrada (0 se não houver registro).
+
+    Args:
+        changes_filepath (str): Caminho do arquivo changes.jsonl.
+    """
+    if not os.path.exists(changes_filepath):
+        return 0
+
+    version = 0
+    with open(changes_filepath, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                version = json.loads(line)["version"]
+    return version
+
+def append_changes(changes: Dict[str, list], changes_filepath: str) -> int:
     """
-    Salva os livros coletados em um arquivo CSV.
+    Registra as diferenças de uma coleta como uma nova versão do catálogo.
+
+    Args:
+        changes (Dict[str, list]): Resultado de diff_books.
+        changes_filepath (str): Caminho do arquivo changes.jsonl.
+
+    Returns:
+        int: Versão atribuída à coleta.
+    """
+    version = last_changes_version(changes_filepath) + 1
+    entry = {
+        "version": version,
+        "scraped_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **changes
+    }
+    with open(changes_filepath, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return version
+
+def save_to_csv(
+    books: List[Dict[str, str]],
+    filepath: str = CSV_FILEPATH,
+    changes_filepath: Optional[str] = None
+) -> None:
+    """
+    Salva os livros coletados em um arquivo CSV e registra as diferenças em
+    relação ao arquivo anterior.
 
     Args:
         books (List[Dict[str, str]]): Lista de livros a serem salvos.
         filepath (str): Caminho do arquivo CSV.
+        changes_filepath (Optional[str]): Caminho do changes.jsonl; por padrão,
+            no mesmo diretório do CSV.
     """
     if not books:
         logging.warning("Nenhum livro para salvar.")
         return
 
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
+    if changes_filepath is None:
+        changes_filepath = os.path.join(os.path.dirname(filepath), CHANGES_FILENAME)
+    changes = diff_books(load_csv(filepath), books)
+
+    # Escreve em arquivo temporário e substitui de uma vez, para que a API
+    # nunca leia um CSV pela metade durante uma recarga.
+    tmp_filepath = filepath + ".tmp"
+    with open(tmp_filepath, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=books[0].keys())
         writer.writeheader()
         writer.writerows(books)
+    os.replace(tmp_filepath, filepath)
 
     logging.info(f"Arquivo CSV salvo em {filepath}")
 
+    version = append_changes(changes, changes_filepath)
+    logging.info(
+        f"Versão {version} registrada em {changes_filepath}: "
+        f"{len(changes['added'])} adicionados, {len(changes['removed'])} removidos, "
+        f"{len(changes['changed'])} alterados."
+    )
+
 # ===== Execução principal =====
 if __name__ == "__main__":
     books_data = scrape_books()